@@ -4,10 +4,11 @@ https://github.com/DEAP/deap
 Here, it's been modified slightly for python3.
 """
 
-from collections import defaultdict
-from itertools import chain
+from collections import defaultdict, deque
+from itertools import chain, islice
+from numbers import Real
 
-class Logbook(list):
+class Logbook:
     """Evolution records as a chronological list of dictionaries.
 
     Data can be retrieved via the :meth:`select` method given the appropriate
@@ -22,6 +23,12 @@ class Logbook(list):
     """
     
     def __init__(self):
+        self._entries = deque()
+        """Chronological entries, held in a :class:`~collections.deque` so
+        that the default ``pop(0)`` is O(1) instead of shifting the whole
+        list on every call.
+        """
+
         self.buffindex = 0
         self.chapters = defaultdict(Logbook)
         """Dictionary containing the sub-sections of the logbook which are also
@@ -59,7 +66,13 @@ class Logbook(list):
 
         """
 
-        self.columns_len = None
+        self.columns_len = {}
+        """Widest formatted value seen so far for each column, keyed by
+        name. Widths for plain values are tracked as entries are appended
+        so :meth:`__txt__` does not have to rescan rows; chapter columns
+        are updated as their text is rendered.
+        """
+
         self.header = None
         """Order of the columns to print when using the :data:`stream` and
         :meth:`__str__` methods. The syntax is a single iterable containing
@@ -81,6 +94,70 @@ class Logbook(list):
         :data:`True`.
         """
 
+        self.flush_interval = 1
+        """Number of :data:`stream` calls to accumulate before the formatted
+        text is actually returned. With the default of 1 every call returns
+        its text immediately; with a larger interval the intermediate calls
+        buffer their output and return an empty string, and the whole batch
+        is returned every *flush_interval* calls (or on :meth:`flush`). This
+        keeps the per-generation cost of ``print(log.stream)`` away from the
+        evolution loop.
+        """
+
+        self._stream_buffer = []
+        self._stream_count = 0
+        self._chapter_width_cache = {}
+        self._header_cache = None
+        self._header_sig = None
+        self._implicit_header = None
+        self._known_keys = set()
+        self._array_cache = None
+        self._col_fmt = {}
+
+    def append(self, entry):
+        """Append *entry* to the chronological list of records."""
+        new_keys = entry.keys() - self._known_keys
+        if new_keys:
+            self._known_keys |= new_keys
+            # extend rather than re-sort: columns already streamed under a
+            # printed header must keep their position
+            if self._implicit_header is not None:
+                self._implicit_header += sorted(new_keys)
+        self._array_cache = None
+        # Track column widths as values arrive so rendering does not have
+        # to rescan the rows. The format is decided once per column, on
+        # the first value recorded for it.
+        col_fmt = self._col_fmt
+        columns_len = self.columns_len
+        for name, value in entry.items():
+            fmt = col_fmt.get(name)
+            if fmt is None:
+                fmt = "{0:n}".format if isinstance(value, float) else str
+                col_fmt[name] = fmt
+            # a non-float in a float column would crash the ':n' format;
+            # fall back to str for that value like the per-cell code did
+            if fmt is not str and not isinstance(value, float):
+                width = len(str(value))
+            else:
+                width = len(fmt(value))
+            if width > columns_len.get(name, 0):
+                columns_len[name] = width
+        self._entries.append(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._entries))
+            if step > 0:
+                return list(islice(self._entries, start, stop, step))
+            return list(self._entries)[key]
+        return self._entries[key]
+
     def record(self, **infos):
         """Enter a record of event in the logbook as a list of key-value pairs.
         The informations are appended chronogically to a list as a dictionnary.
@@ -88,11 +165,16 @@ class Logbook(list):
         in the dictionnary are recorded in a chapter entitled as the name of the
         key part of the pair. Chapters are also Logbook.
         """
-        for key, value in infos.items():
-            if isinstance(value, dict):
-                self.chapters[key].record(**value)
-                del infos[key]
-        self.append(infos)
+        chapters = {key: value for key, value in infos.items()
+                    if isinstance(value, dict)}
+        main = {key: value for key, value in infos.items()
+                if key not in chapters}
+        new_chapters = chapters.keys() - self.chapters.keys()
+        if new_chapters and self._implicit_header is not None:
+            self._implicit_header += sorted(new_chapters)
+        for key, value in chapters.items():
+            self.chapters[key].record(**value)
+        self.append(main)
 
     def select(self, *names):
         """Return a list of values associated to the *names* provided
@@ -122,9 +204,63 @@ class Logbook(list):
             >>> log.chapters['fit'].select("gen", "max")
             ([0, 1], [1.5, 1.7])
         """
+        # dict.get is bound once so no LOAD_ATTR happens per entry;
+        # entries are always plain dicts.
+        get = dict.get
         if len(names) == 1:
-            return [entry.get(names[0], None) for entry in self]
-        return tuple([entry.get(name, None) for entry in self] for name in names)
+            name = names[0]
+            return [get(entry, name) for entry in self._entries]
+        # One pass filling all columns rather than one pass per name;
+        # bound appends skip the attribute lookup in the inner loop.
+        cols = tuple([] for _ in names)
+        appends = [col.append for col in cols]
+        for entry in self._entries:
+            for append, name in zip(appends, names):
+                append(get(entry, name))
+        return cols
+
+    def select_numpy(self, *names):
+        """Same as :meth:`select` but with the values returned as NumPy
+        arrays (one per name), ready for vectorized post-processing of
+        long evolution histories.
+        """
+        import numpy as np
+
+        if len(names) == 1:
+            return np.array(self.select(*names))
+        return tuple(np.array(col) for col in self.select(*names))
+
+    def to_arrays(self):
+        """Return every numeric column of the logbook as a dictionary of
+        ``float64`` NumPy arrays, one entry per key, with missing values
+        stored as ``nan``. This packs the per-generation dictionaries into
+        flat arrays so whole-history statistics can run vectorized instead
+        of looping over entries. The result is cached and rebuilt only
+        after the logbook has been modified.
+        """
+        import numpy as np
+
+        if self._array_cache is not None:
+            return self._array_cache
+        # numbers.Real also covers NumPy scalars such as np.int64, which
+        # does not subclass int; bools are excluded rather than becoming
+        # 1.0/0.0 columns.
+        numeric = set()
+        for entry in self._entries:
+            for name, value in entry.items():
+                if isinstance(value, Real) and not isinstance(value, bool):
+                    numeric.add(name)
+        n = len(self._entries)
+        arrays = {name: np.empty(n, dtype=np.float64) for name in numeric}
+        for i, entry in enumerate(self._entries):
+            get = entry.get
+            for name in numeric:
+                value = get(name)
+                arrays[name][i] = (value if isinstance(value, Real)
+                                   and not isinstance(value, bool)
+                                   else np.nan)
+        self._array_cache = arrays
+        return arrays
 
     @property
     def stream(self):
@@ -142,19 +278,46 @@ class Logbook(list):
               1
         """
         startindex, self.buffindex = self.buffindex, len(self)
-        return self.__str__(startindex)
+        text = self.__str__(startindex)
+        if self.flush_interval > 1:
+            self._stream_count += 1
+            # a no-op flush yields an empty string; buffering it would
+            # inject blank lines into the joined batch
+            if text:
+                self._stream_buffer.append(text)
+            if self._stream_count < self.flush_interval:
+                return ""
+            return self.flush()
+        return text
+
+    def flush(self):
+        """Return and clear the output accumulated by :data:`stream` calls
+        when :data:`flush_interval` is greater than 1. Call this before
+        exiting to recover any rows still sitting in the buffer.
+        """
+        text = "\n".join(self._stream_buffer)
+        self._stream_buffer = []
+        self._stream_count = 0
+        return text
 
     def __delitem__(self, key):
         if isinstance(key, slice):
-            for i, in range(*key.indices(len(self))):
-                self.pop(i)
-                for chapter in self.chapters.values():
-                    chapter.pop(i)
+            for book in chain((self,), self.chapters.values()):
+                book._array_cache = None
+                dead = set(range(*key.indices(len(book._entries))))
+                book.buffindex -= sum(1 for i in dead if i < book.buffindex)
+                book._entries = deque(
+                    entry for i, entry in enumerate(book._entries)
+                    if i not in dead)
         else:
-            self.pop(key)
-            for chapter in self.chapters.values():
-                chapter.pop(key)
-        
+            if key < 0:
+                key += len(self)
+            for book in chain((self,), self.chapters.values()):
+                book._array_cache = None
+                if key < book.buffindex:
+                    book.buffindex -= 1
+                del book._entries[key]
+
     def pop(self, index=0):
         """Retrieve and delete element *index*. The header and stream will be
         adjusted to follow the modification.
@@ -170,14 +333,31 @@ class Logbook(list):
         """
         if index < self.buffindex:
             self.buffindex -= 1
-        return super(self.__class__, self).pop(index)
+        self._array_cache = None
+        if index == 0:
+            return self._entries.popleft()
+        entry = self._entries[index]
+        del self._entries[index]
+        return entry
 
     def __txt__(self, startindex):
+        # Nothing new to format: neither the log nor any chapter has rows
+        # past startindex. This also covers streaming from a still-empty
+        # logbook, which used to crash building the implicit header.
+        if startindex >= len(self._entries) and all(
+                len(chapter) == startindex
+                for chapter in self.chapters.values()):
+            return []
+
         columns = self.header
         if not columns:
-            columns = sorted(self[0].keys()) + sorted(self.chapters.keys())
-        if not self.columns_len or len(self.columns_len) != len(columns):
-            self.columns_len = list(map(len, columns))
+            # Built once from the keys seen so far; keys or chapters that
+            # appear later are appended to the end of the cached order so
+            # previously streamed columns never move.
+            if self._implicit_header is None:
+                self._implicit_header = (sorted(self._known_keys) +
+                                         sorted(self.chapters.keys()))
+            columns = self._implicit_header
 
         chapters_txt = {}
         offsets = defaultdict(int)
@@ -187,44 +367,75 @@ class Logbook(list):
                 offsets[name] = len(chapters_txt[name]) - len(self)
 
         str_matrix = []
+        col_fmt = self._col_fmt
+        columns_len = self.columns_len
         for i, line in enumerate(self[startindex:]):
             str_line = []
-            for j, name in enumerate(columns):
+            for name in columns:
                 if name in chapters_txt:
                     column = chapters_txt[name][i+offsets[name]]
+                    # plain value widths are tracked in append(); chapter
+                    # cells are only known once their text is rendered
+                    if len(column) > columns_len.get(name, 0):
+                        columns_len[name] = len(column)
+                elif name not in line:
+                    column = ""
                 else:
-                    value = line.get(name, "")
-                    string = "{0:n}" if isinstance(value, float) else "{0}"
-                    column = string.format(value)
-                self.columns_len[j] = max(self.columns_len[j], len(column))
+                    value = line[name]
+                    fmt = col_fmt[name]
+                    if fmt is not str and not isinstance(value, float):
+                        column = str(value)
+                    else:
+                        column = fmt(value)
                 str_line.append(column)
             str_matrix.append(str_line)
 
-        if startindex == 0 and self.log_header:
-            header = []
-            nlines = 1
-            if len(self.chapters) > 0:
-                nlines += max(map(len, chapters_txt.values())) - len(self) + 1
-            header = [[] for i in range(nlines)]
-            for j, name in enumerate(columns):
-                if name in chapters_txt:
-                    length = max(len(line.expandtabs()) for line in chapters_txt[name])
-                    blanks = nlines - 2 - offsets[name]
-                    for i in range(blanks):
-                        header[i].append(" " * length)
-                    header[blanks].append(name.center(length))
-                    header[blanks+1].append("-" * length)
-                    for i in range(offsets[name]):
-                        header[blanks+2+i].append(chapters_txt[name][i])
-                else:
-                    length = max(len(line[j].expandtabs()) for line in str_matrix)
-                    for line in header[:-1]:
-                        line.append(" " * length)
-                    header[-1].append(name)
-            str_matrix = chain(header, str_matrix)
+        widths = tuple(max(columns_len.get(name, 0), len(name))
+                       for name in columns)
 
-        template = "\t".join("{%i:<%i}" % (i, l) for i, l in enumerate(self.columns_len))
-        text = [template.format(*line) for line in str_matrix]
+        if startindex == 0 and self.log_header:
+            # The rendered header only depends on the column names, the
+            # chapter set, the column widths and the chapter offsets (the
+            # header embeds the first offsets[name] chapter rows); rebuild
+            # it when one of those changes and reuse the cached rows
+            # otherwise.
+            sig = (widths, tuple(self.chapters.keys()), tuple(columns),
+                   tuple(sorted(offsets.items())))
+            if sig != self._header_sig:
+                nlines = 1
+                if len(self.chapters) > 0:
+                    nlines += max(map(len, chapters_txt.values())) - len(self) + 1
+                header = [[] for i in range(nlines)]
+                for j, name in enumerate(columns):
+                    if name in chapters_txt:
+                        # Widths only change when the chapter grows, so reuse
+                        # the last computed value while the row count matches.
+                        nrows = len(chapters_txt[name])
+                        cached = self._chapter_width_cache.get(name)
+                        if cached is not None and cached[0] == nrows:
+                            length = cached[1]
+                        else:
+                            length = max(len(line.expandtabs())
+                                         for line in chapters_txt[name])
+                            self._chapter_width_cache[name] = (nrows, length)
+                        blanks = nlines - 2 - offsets[name]
+                        for i in range(blanks):
+                            header[i].append(" " * length)
+                        header[blanks].append(name.center(length))
+                        header[blanks+1].append("-" * length)
+                        for i in range(offsets[name]):
+                            header[blanks+2+i].append(chapters_txt[name][i])
+                    else:
+                        length = widths[j]
+                        for line in header[:-1]:
+                            line.append(" " * length)
+                        header[-1].append(name)
+                self._header_sig = sig
+                self._header_cache = header
+            str_matrix = chain(self._header_cache, str_matrix)
+
+        text = ["\t".join(col.ljust(l) for col, l in zip(line, widths))
+                for line in str_matrix]
 
         return text
 
@@ -232,34 +443,53 @@ class Logbook(list):
         text = self.__txt__(startindex)
         return "\n".join(text)
 
-def disp_tree(tree):
+_plot_executor = None
+_pending_plot = None
 
-	from igraph import Graph, plot
-
-	g = Graph(directed=True)
-	g.add_vertices(len(tree))
+def finish_plots():
+	"""Wait for any plot still rendering in the background and shut the
+	plotting thread down. Call this before the program exits.
+	"""
+	global _plot_executor, _pending_plot
+	if _plot_executor is not None:
+		_plot_executor.shutdown(wait=True)
+		_plot_executor = None
+		_pending_plot = None
 
-	g.vs['label'] = [node.name for node in tree]
+def disp_tree(tree):
+	"""Plot *tree* with igraph. The graph and layout are built on the
+	calling thread but the actual rendering runs on a background thread
+	so the evolution loop is not blocked; a plot still queued when the
+	next call arrives is dropped in favour of the newer tree. Returns the
+	:class:`~concurrent.futures.Future` of the rendering call.
+	"""
 
-	nodes_to_add = set([0])
-	while len(nodes_to_add) != 0:
+	from igraph import Graph, plot
 
-		i_node = nodes_to_add.pop()
-		node = tree[i_node]
-		g.vs['label'][i_node] = node.name
+	# id() keys give O(1) lookups without relying on node __eq__
+	idx = {id(node): i for i, node in enumerate(tree)}
 
-		left_node = node.left_child
-		right_node = node.right_child
+	# tree already holds every node, so one linear pass over it yields
+	# all parent->child edges; no traversal from the root is needed
+	edges = []
+	for i, node in enumerate(tree):
+		if node.left_child is not None:
+			edges.append((i, idx[id(node.left_child)]))
+		if node.right_child is not None:
+			edges.append((i, idx[id(node.right_child)]))
 
-		if left_node != None:
-			i_left = tree.index(left_node)
-			g.add_edges((i_node, i_left))
-			nodes_to_add.add(i_left)
-		
-		if right_node != None:
-			i_right = tree.index(right_node)
-			g.add_edges((i_node, i_right))
-			nodes_to_add.add(i_right)
+	g = Graph(n=len(tree), edges=edges, directed=True)
+	g.vs['label'] = [node.name for node in tree]
 
 	layout = g.layout_reingold_tilford(root=0)
-	plot(g, layout=layout, bbox=(0, 0, 3000, 1000))
\ No newline at end of file
+
+	global _plot_executor, _pending_plot
+	if _plot_executor is None:
+		from concurrent.futures import ThreadPoolExecutor
+		_plot_executor = ThreadPoolExecutor(max_workers=1)
+	if _pending_plot is not None:
+		# coalesce: only the most recent tree is worth rendering
+		_pending_plot.cancel()
+	_pending_plot = _plot_executor.submit(
+		plot, g, layout=layout, bbox=(0, 0, 3000, 1000))
+	return _pending_plot
\ No newline at end of file